@@ -153,6 +153,8 @@ async def main():
     except Exception as e:
         __error_exit(repr(e))
     finally:
+        __close_console()
+        __export_telemetry()
         __exit()
 
 from browser import aio
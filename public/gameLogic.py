@@ -1,6 +1,7 @@
 import random
+from collections import deque
 from enum import Enum
-from math import floor
+from math import exp, floor
 from time import time
 from typing import Iterable
 
@@ -12,6 +13,10 @@ __BUCKET_FILL_PERCENTAGE_PER_SECOND = 0.05
 __MAX_WATER_SPEEDUP = 5
 __POWER_DECAY_RATE_PER_OPERATION = 0.00002
 __WATER_BUCKET_FILL_RATE = 0.25
+__CONSOLE_BUFFER_SIZE = 256
+__CONSOLE_MAX_MESSAGES_PER_SECOND = 20
+__TELEMETRY_SAMPLE_INTERVAL = 1.0
+__TELEMETRY_MAX_SAMPLES = 600
 
 
 # All functions in this file are meant to be used in the user's code.
@@ -50,7 +55,7 @@ class Item(Enum):
 
     @property
     def required_items(self) -> list[tuple['Item', int]]:
-        return [(__get_item_from_identifier(item), count) for item, count in self.value[1]]
+        return list(__ITEM_RECIPES[__ITEM_CODE[self]])
 
 
 __USABLE_ITEMS = [Item.FULL_BUCKET, Item.FERTILIZER]
@@ -84,25 +89,49 @@ class Ground(Enum):
     TILLED = 'Tilled'
 
 
-def __get_entity_from_identifier(identifier: str) -> Entity:
-    for entity in Entity:
-        if entity.name == identifier:
-            return entity
-    raise ValueError(f'Invalid entity name: {identifier}')
+# Flat metadata tables, indexed by the dense int code of each enum member (its position in the enum).
+# The field stores the member names, so the name -> code tables are the only lookup needed per cell.
+__ITEMS = tuple(Item)
+__ITEM_CODE = {item: code for code, item in enumerate(__ITEMS)}
+__ITEM_CODE_BY_NAME = {item.name: code for code, item in enumerate(__ITEMS)}
+__ITEM_RECIPES = tuple(
+    tuple((__ITEMS[__ITEM_CODE_BY_NAME[name]], count) for name, count in item.value[1]) for item in __ITEMS
+)
+
+__ENTITIES = tuple(Entity)
+__ENTITY_CODE = {entity: code for code, entity in enumerate(__ENTITIES)}
+__ENTITY_CODE_BY_NAME = {entity.name: code for code, entity in enumerate(__ENTITIES)}
+__ENTITY_REQUIRED_ITEMS = tuple(tuple(entity.value[1]) for entity in __ENTITIES)
+__ENTITY_TILLED_REQUIRED = tuple(entity.value[2] for entity in __ENTITIES)
+__ENTITY_GROWTH_RATE = tuple(entity.value[3] for entity in __ENTITIES)
+__ENTITY_MEASURE_RANGE = tuple(None if entity.value[4] is None else tuple(entity.value[4]) for entity in __ENTITIES)
+__ENTITY_HARVEST_ITEM = tuple(__ENTITY_TO_ITEM.get(entity) for entity in __ENTITIES)
+
+__NOTHING_CODE = __ENTITY_CODE[Entity.NOTHING]
+__TREE_CODE = __ENTITY_CODE[Entity.TREE]
+
+__GROUNDS = tuple(Ground)
+__GROUND_CODE_BY_NAME = {ground.name: code for code, ground in enumerate(__GROUNDS)}
 
+__DIRECTION_DELTA = tuple(direction.value[1] for direction in Direction)
 
-def __get_item_from_identifier(identifier: str) -> Item:
-    for item in Item:
-        if item.name == identifier:
-            return item
-    raise ValueError(f'Invalid item name: {identifier}')
+
+def __get_entity_code_from_identifier(identifier: str) -> int:
+    code = __ENTITY_CODE_BY_NAME.get(identifier)
+    if code is None:
+        raise ValueError(f'Invalid entity name: {identifier}')
+    return code
+
+
+def __get_entity_from_identifier(identifier: str) -> Entity:
+    return __ENTITIES[__get_entity_code_from_identifier(identifier)]
 
 
 def __get_ground_from_identifier(identifier: str) -> Ground:
-    for ground in Ground:
-        if ground.name == identifier:
-            return ground
-    raise ValueError(f'Invalid ground name: {identifier}')
+    code = __GROUND_CODE_BY_NAME.get(identifier)
+    if code is None:
+        raise ValueError(f'Invalid ground name: {identifier}')
+    return __GROUNDS[code]
 
 
 class __Settings:
@@ -141,6 +170,12 @@ class __Drone:
     def last_position(cls) -> list[int]:
         return window.game_data['drone']['last_position']
 
+    @classmethod
+    @property
+    def id(cls) -> int:
+        # Only a single drone exists for now
+        return 0
+
 
 class __Field:
     @staticmethod
@@ -154,6 +189,10 @@ class __Field:
     def get_type(x: int, y: int) -> Entity:
         return __get_entity_from_identifier(__Field._get(x, y)['type'])
 
+    @staticmethod
+    def get_type_code(x: int, y: int) -> int:
+        return __get_entity_code_from_identifier(__Field._get(x, y)['type'])
+
     @staticmethod
     def set_type(x: int, y: int, entity: Entity) -> None:
         __Field._get(x, y)['type'] = entity.name
@@ -216,6 +255,75 @@ class __Inventory:
         __Inventory.set(item, __Inventory.get(item) - value)
 
 
+# Messages printed by the user's code are buffered here and handed to the UI in batches once per frame.
+# At most __CONSOLE_MAX_MESSAGES_PER_SECOND messages are kept per simulated second, the rest is only counted
+# and summarised, so scripts printing in every cell don't flood the UI.
+__console_buffer = deque(maxlen=__CONSOLE_BUFFER_SIZE)
+__console_window_start = 0.0
+__console_window_count = 0
+__console_dropped = 0
+
+
+def __append_to_console_buffer(message: str) -> None:
+    global __console_dropped
+
+    if len(__console_buffer) == __CONSOLE_BUFFER_SIZE:
+        # The oldest message is overwritten by the ring buffer
+        __console_dropped += 1
+
+    __console_buffer.append({'time': window.game_data['time'], 'drone': __Drone.id, 'message': message})
+
+
+def __roll_console_window() -> None:
+    # Starts a new rate limiting window once the current one is over and reports what was dropped in it
+    global __console_window_start, __console_window_count
+
+    current_time = window.game_data['time']
+    if current_time - __console_window_start >= 1:
+        __summarise_dropped_console_messages()
+        __console_window_start = current_time
+        __console_window_count = 0
+
+
+def __log_to_console(message: str) -> None:
+    global __console_window_count, __console_dropped
+
+    __roll_console_window()
+
+    if __console_window_count >= __CONSOLE_MAX_MESSAGES_PER_SECOND:
+        __console_dropped += 1
+        return
+
+    __console_window_count += 1
+    __append_to_console_buffer(message)
+
+
+def __summarise_dropped_console_messages() -> None:
+    global __console_dropped
+
+    if __console_dropped > 0:
+        # Reset before appending, so an entry evicted by the summary itself is counted for the next summary
+        dropped = __console_dropped
+        __console_dropped = 0
+        __append_to_console_buffer(f'... {dropped} messages dropped')
+
+
+def __flush_console() -> None:
+    # Also checked here, as __system flushes every frame, so drops show up even if nothing is printed anymore
+    __roll_console_window()
+    if not __console_buffer:
+        return
+    window.game_data.communication.console = list(window.game_data.communication.console) + list(__console_buffer)
+    __console_buffer.clear()
+
+
+def __close_console() -> None:
+    # Flush first, so the final summary has room in the buffer and cannot evict anything
+    __flush_console()
+    __summarise_dropped_console_messages()
+    __flush_console()
+
+
 # window.game_data = {
 #     'unlocks': {
 #         'speed': 1,
@@ -254,13 +362,10 @@ async def __system(num_operations=__DEFAULT_NUM_OPERATIONS) -> None:
     if delta_time > 1 / 60:
         __last_update_time = time()
 
-        window.game_data['time'] += delta_time
-
-        for x in range(__Settings.current_world_size):
-            for y in range(__Settings.current_world_size):
-                __update_field(x, y, delta_time)
-
+        __fast_forward(delta_time)
         __fill_buckets()
+        __sample_telemetry()
+        __flush_console()
 
     __remove_power(num_operations)
     sleep_time = __calculate_delay_time_for_operations(num_operations)
@@ -268,46 +373,144 @@ async def __system(num_operations=__DEFAULT_NUM_OPERATIONS) -> None:
 
 
 def __fill_buckets() -> None:
-    global __last_bucket_fill_time
+    global __last_bucket_fill_time, __telemetry_buckets_filled
+    # fastForward in src/gameLogic/logic.ts copies this refill for offline time, change both together
     # Fill 5% of the empty buckets with water every second
     time_since_last_fill = time() - __last_bucket_fill_time
     buckets_to_fill = int(time_since_last_fill * __BUCKET_FILL_PERCENTAGE_PER_SECOND)
     __last_bucket_fill_time += buckets_to_fill / __BUCKET_FILL_PERCENTAGE_PER_SECOND
+    # Only existing empty buckets can be filled
+    buckets_to_fill = min(buckets_to_fill, max(0, int(__Inventory.get(Item.EMPTY_BUCKET))))
     __Inventory.add(Item.FULL_BUCKET, buckets_to_fill)
     __Inventory.remove(Item.EMPTY_BUCKET, buckets_to_fill)
+    __telemetry_buckets_filled += buckets_to_fill
 
 
 def __remove_power(num_operations: int) -> None:
+    global __telemetry_power_drained
     # remove a bit of power for each operation
     power_to_remove = num_operations * __POWER_DECAY_RATE_PER_OPERATION
-    __Inventory.set(Item.POWER, max(0, __Inventory.get(Item.POWER) - power_to_remove))
+    power = __Inventory.get(Item.POWER)
+    __Inventory.set(Item.POWER, max(0, power - power_to_remove))
+    __telemetry_power_drained += min(power, power_to_remove)
 
 
-def __update_field(x: int, y: int, delta_time: float) -> None:
-    entity = __Field.get_type(x, y)
+# Time series of the production over a run, sampled every __TELEMETRY_SAMPLE_INTERVAL simulated seconds.
+# Every series is a ring buffer of __TELEMETRY_MAX_SAMPLES entries, so arbitrarily long runs use bounded memory.
+__telemetry_series = {
+    name: deque(maxlen=__TELEMETRY_MAX_SAMPLES)
+    for name in ['time', 'power_drained', 'buckets_filled', 'growth_utilisation']
+}
+__telemetry_inventory = {item.name: deque(maxlen=__TELEMETRY_MAX_SAMPLES) for item in Item}
+__telemetry_produced_per_minute = {item.name: deque(maxlen=__TELEMETRY_MAX_SAMPLES) for item in Item}
+__telemetry_last_sample_time = None
+# Accumulated since the last sample
+__telemetry_produced = {item.name: 0 for item in Item}
+__telemetry_power_drained = 0.0
+__telemetry_buckets_filled = 0
+
+
+def __growth_utilisation() -> float:
+    # Fraction of the field that is currently growing, i.e. neither empty nor waiting to be harvested
+    world_size = __Settings.current_world_size
+    growing = 0
+    for x in range(world_size):
+        for y in range(world_size):
+            if __Field.get_type_code(x, y) != __NOTHING_CODE and __Field.get_growth(x, y) < 1:
+                growing += 1
+    return growing / (world_size * world_size)
+
+
+def __record_telemetry_sample(current_time: float) -> None:
+    # Closes the interval since the last sample, the elapsed time must be greater than zero
+    global __telemetry_last_sample_time, __telemetry_power_drained, __telemetry_buckets_filled
+
+    elapsed_time = current_time - __telemetry_last_sample_time
+
+    __telemetry_series['time'].append(current_time)
+    __telemetry_series['power_drained'].append(__telemetry_power_drained)
+    __telemetry_series['buckets_filled'].append(__telemetry_buckets_filled)
+    __telemetry_series['growth_utilisation'].append(__growth_utilisation())
+
+    for item in __ITEMS:
+        __telemetry_inventory[item.name].append(__Inventory.get(item))
+        __telemetry_produced_per_minute[item.name].append(__telemetry_produced[item.name] * 60 / elapsed_time)
+        __telemetry_produced[item.name] = 0
+
+    __telemetry_last_sample_time = current_time
+    __telemetry_power_drained = 0.0
+    __telemetry_buckets_filled = 0
 
-    if entity != Entity.NOTHING:
-        water_level = __Field.get_water(x, y)
-        growth_rate = entity.value[3] * (__MAX_WATER_SPEEDUP * water_level + 1)
 
-        if entity == Entity.TREE:
+def __sample_telemetry() -> None:
+    global __telemetry_last_sample_time
+
+    current_time = window.game_data['time']
+    if __telemetry_last_sample_time is None:
+        # The first call only starts the first sample interval, everything accumulated so far belongs to it
+        __telemetry_last_sample_time = current_time
+        return
+
+    if current_time - __telemetry_last_sample_time >= __TELEMETRY_SAMPLE_INTERVAL:
+        __record_telemetry_sample(current_time)
+
+
+def __export_telemetry() -> None:
+    # The last interval is usually shorter than __TELEMETRY_SAMPLE_INTERVAL, record it so nothing at the end is lost
+    current_time = window.game_data['time']
+    if __telemetry_last_sample_time is not None and current_time > __telemetry_last_sample_time:
+        __record_telemetry_sample(current_time)
+
+    window.game_data.telemetry = {
+        'interval': __TELEMETRY_SAMPLE_INTERVAL,
+        **{name: list(values) for name, values in __telemetry_series.items()},
+        'inventory': {name: list(values) for name, values in __telemetry_inventory.items()},
+        'produced_per_minute': {name: list(values) for name, values in __telemetry_produced_per_minute.items()},
+    }
+
+
+def __fast_forward(delta_time: float) -> None:
+    # Advances the whole field by delta_time in a single pass over the cells.
+    # The field is integrated analytically, so the cost does not depend on the length of the time span.
+    window.game_data['time'] += delta_time
+
+    for x in range(__Settings.current_world_size):
+        for y in range(__Settings.current_world_size):
+            __update_field(x, y, delta_time)
+
+
+def __update_field(x: int, y: int, delta_time: float) -> None:
+    # fastForward in src/gameLogic/logic.ts copies this update for offline time, change both together.
+    # The water level decays exponentially: w(t) = w0 * e^(-decay * t)
+    water_level = __Field.get_water(x, y)
+    water_decay_factor = exp(-__WATER_DECAY_RATE_PER_SECOND * delta_time)
+    entity_code = __Field.get_type_code(x, y)
+
+    if entity_code != __NOTHING_CODE:
+        # Integral of the water speedup (__MAX_WATER_SPEEDUP * w(t) + 1) over delta_time
+        boosted_time = (
+            delta_time + __MAX_WATER_SPEEDUP * water_level * (1 - water_decay_factor) / __WATER_DECAY_RATE_PER_SECOND
+        )
+        growth_rate = __ENTITY_GROWTH_RATE[entity_code]
+
+        if entity_code == __TREE_CODE:
             # Trees grow slower if there are trees around
-            for dir in Direction:
-                nx, ny = __position_in_direction(x, y, dir)
-                if __Field.get_type(nx, ny) == Entity.TREE:
+            world_size = __Settings.current_world_size
+            for dx, dy in __DIRECTION_DELTA:
+                nx, ny = (x + dx + world_size) % world_size, (y + dy + world_size) % world_size
+                if __Field.get_type_code(nx, ny) == __TREE_CODE:
                     growth_rate *= 0.5
 
-        __Field.set_growth(x, y, __Field.get_growth(x, y) + growth_rate * delta_time)
+        __Field.set_growth(x, y, __Field.get_growth(x, y) + growth_rate * boosted_time)
 
-    # decay water level
-    water_decay = __WATER_DECAY_RATE_PER_SECOND * __Field.get_water(x, y) * delta_time
-    __Field.set_water(x, y, __Field.get_water(x, y) - water_decay)
+    __Field.set_water(x, y, water_level * water_decay_factor)
 
 
 def __position_in_direction(x: int, y: int, dir: Direction) -> tuple[int, int]:
     dx, dy = dir.value[1]
-    nx = (x + dx + __Settings.current_world_size) % __Settings.current_world_size
-    ny = (y + dy + __Settings.current_world_size) % __Settings.current_world_size
+    world_size = __Settings.current_world_size
+    nx = (x + dx + world_size) % world_size
+    ny = (y + dy + world_size) % world_size
     return nx, ny
 
 
@@ -420,15 +623,22 @@ def __measure_field_of_type(entity: Entity) -> dict[tuple[int, int], int]:
     return measurements
 
 
+def __add_harvested_items(item: Item, count: int) -> None:
+    # Harvesting is the only production of items, trades and planting only convert them
+    __Inventory.add(item, count)
+    __telemetry_produced[item.name] += count
+
+
 async def harvest() -> bool:
     x, y = __Drone.position
-    entity = __Field.get_type(x, y)
+    entity_code = __Field.get_type_code(x, y)
 
-    if entity == Entity.NOTHING:
+    if entity_code == __NOTHING_CODE:
         await __system(num_operations=1)
         return False
 
-    item = __ENTITY_TO_ITEM[entity]
+    entity = __ENTITIES[entity_code]
+    item = __ENTITY_HARVEST_ITEM[entity_code]
     grown = __Field.get_growth(x, y) >= 1
 
     if entity == Entity.PUMPKIN and grown:
@@ -436,7 +646,7 @@ async def harvest() -> bool:
         coloring = __get_pumpkin_coloring()
         color = coloring[(x, y)]
         num_pumpkins = sum(1 for c in coloring.values() if c == color)
-        __Inventory.add(item, int(num_pumpkins**1.5))
+        __add_harvested_items(item, int(num_pumpkins**1.5))
         for (nx, ny), c in coloring.items():
             if c == color:
                 __reset_field(nx, ny)
@@ -448,7 +658,7 @@ async def harvest() -> bool:
 
         max_sunflower = max(all_sunflowers.values())
         if all_sunflowers[(x, y)] == max_sunflower:
-            __Inventory.add(item, len(all_sunflowers))
+            __add_harvested_items(item, len(all_sunflowers))
             __reset_field(x, y)
         else:
             __reset_multiple_fields(all_sunflowers.keys())
@@ -467,12 +677,12 @@ async def harvest() -> bool:
                         await __system()
                         return True
 
-        __Inventory.add(item, len(all_cacti) ** 2)
+        __add_harvested_items(item, len(all_cacti) ** 2)
         __reset_multiple_fields(all_cacti.keys())
     else:
         # Harvesting
         if grown:
-            __Inventory.add(item, 1)
+            __add_harvested_items(item, 1)
         __reset_field(x, y)
 
     await __system()
@@ -486,7 +696,10 @@ async def can_harvest() -> bool:
 
 async def plant(entity: Entity) -> bool:
     x, y = __Drone.position
-    name, required_items, tilled_required, growth_rate, measure_data = entity.value
+    entity_code = __ENTITY_CODE[entity]
+    required_items = __ENTITY_REQUIRED_ITEMS[entity_code]
+    tilled_required = __ENTITY_TILLED_REQUIRED[entity_code]
+    measure_data = __ENTITY_MEASURE_RANGE[entity_code]
 
     invalid_till_state = tilled_required and __Field.get_ground(x, y) != Ground.TILLED
     not_enough_resources = any(__Inventory.get(item) < 1 for item in required_items)
@@ -508,8 +721,7 @@ async def till():
     x, y = __Drone.position
     if __Field.get_ground(x, y) == Ground.TILLED:
         __Field.set_ground(x, y, Ground.DIRT)
-        tilled_required = __Field.get_type(x, y).value[2]
-        if tilled_required:
+        if __ENTITY_TILLED_REQUIRED[__Field.get_type_code(x, y)]:
             __Field.set_type(x, y, Entity.NOTHING)
             __Field.set_growth(x, y, 0.0)
     else:
@@ -518,16 +730,17 @@ async def till():
 
 
 async def trade(item: Item) -> bool:
-    not_buyable = not item.required_items  # not buyable if no required items
-    not_enough_resources = any(__Inventory.get(item) < count for item, count in item.required_items)
+    required_items = __ITEM_RECIPES[__ITEM_CODE[item]]
+    not_buyable = not required_items  # not buyable if no required items
+    not_enough_resources = any(__Inventory.get(required) < count for required, count in required_items)
 
     if not_enough_resources or not_buyable:
         await __system(num_operations=1)
         return False
 
     __Inventory.add(item, 1)
-    for item, count in item.required_items:
-        __Inventory.remove(item, count)
+    for required, count in required_items:
+        __Inventory.remove(required, count)
     await __system()
     return True
 
@@ -540,7 +753,7 @@ async def use_item(item: Item) -> bool:
     x, y = __Drone.position
     if item == Item.FERTILIZER:
         # Grow the plant by 2sec worth of growth
-        entity_growth_rate = __Field.get_type(x, y).value[3]
+        entity_growth_rate = __ENTITY_GROWTH_RATE[__Field.get_type_code(x, y)]
         __Field.set_growth(x, y, __Field.get_growth(x, y) + 2.0 * entity_growth_rate)
     elif item == Item.FULL_BUCKET:
         __Field.set_water(x, y, __Field.get_water(x, y) + __WATER_BUCKET_FILL_RATE)
@@ -579,6 +792,7 @@ async def num_items(item: Item) -> int:
     return floor(__Inventory.get(item))
 
 
-async def _mprint(*args, **kwargs):
-    print('My Print', *args, **kwargs)
+async def _mprint(*args, sep=' ', end=''):
+    # Every print is its own console message, so the newline print usually ends with is implied
+    __log_to_console(sep.join(str(arg) for arg in args) + end)
     await __system(num_operations=500)
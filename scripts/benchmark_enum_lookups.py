@@ -0,0 +1,84 @@
+# Microbenchmark of the enum metadata tables in public/gameLogic.py against the linear scans they replaced.
+# Runs under plain CPython: the browser module only exists in Brython, so it is replaced by an empty stub.
+# Usage: python scripts/benchmark_enum_lookups.py
+
+import sys
+import types
+from pathlib import Path
+from timeit import timeit
+
+NUMBER = 200_000
+
+browser = types.ModuleType('browser')
+browser.aio = None
+browser.window = None
+sys.modules['browser'] = browser
+
+game_logic = {}
+exec((Path(__file__).parent.parent / 'public' / 'gameLogic.py').read_text(), game_logic)
+
+Direction, Entity, Item = game_logic['Direction'], game_logic['Entity'], game_logic['Item']
+
+
+# The lookups as they were implemented before the metadata tables
+def old_get_entity_from_identifier(identifier: str):
+    for entity in Entity:
+        if entity.name == identifier:
+            return entity
+    raise ValueError(f'Invalid entity name: {identifier}')
+
+
+def old_get_item_from_identifier(identifier: str):
+    for item in Item:
+        if item.name == identifier:
+            return item
+    raise ValueError(f'Invalid item name: {identifier}')
+
+
+get_entity_code = game_logic['__get_entity_code_from_identifier']
+get_entity = game_logic['__get_entity_from_identifier']
+entity_growth_rate = game_logic['__ENTITY_GROWTH_RATE']
+entity_tilled_required = game_logic['__ENTITY_TILLED_REQUIRED']
+item_code, item_recipes = game_logic['__ITEM_CODE'], game_logic['__ITEM_RECIPES']
+direction_delta = game_logic['__DIRECTION_DELTA']
+
+CASES = {
+    # name: (old, new)
+    'entity lookup (first member)': (
+        lambda: old_get_entity_from_identifier('NOTHING'),
+        lambda: get_entity('NOTHING'),
+    ),
+    'entity lookup (last member)': (
+        lambda: old_get_entity_from_identifier('CACTUS'),
+        lambda: get_entity('CACTUS'),
+    ),
+    'growth rate of a cell': (
+        lambda: old_get_entity_from_identifier('SUNFLOWER').value[3],
+        lambda: entity_growth_rate[get_entity_code('SUNFLOWER')],
+    ),
+    'tilled requirement of a cell': (
+        lambda: old_get_entity_from_identifier('PUMPKIN').value[2],
+        lambda: entity_tilled_required[get_entity_code('PUMPKIN')],
+    ),
+    'item recipe': (
+        lambda: [(old_get_item_from_identifier(name), count) for name, count in Item.CARROT_SEED.value[1]],
+        lambda: item_recipes[item_code[Item.CARROT_SEED]],
+    ),
+    'neighbour deltas (tree crowding)': (
+        lambda: [direction.value[1] for direction in Direction],
+        lambda: [delta for delta in direction_delta],
+    ),
+}
+
+
+def main() -> None:
+    print(f'{"case":<32}{"old (us)":>10}{"new (us)":>10}{"speedup":>10}')
+    for name, (old, new) in CASES.items():
+        assert old() == new() or list(old()) == list(new())
+        old_time = timeit(old, number=NUMBER) / NUMBER * 1e6
+        new_time = timeit(new, number=NUMBER) / NUMBER * 1e6
+        print(f'{name:<32}{old_time:>10.3f}{new_time:>10.3f}{old_time / new_time:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
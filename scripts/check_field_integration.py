@@ -0,0 +1,92 @@
+# Checks the analytic field update in public/gameLogic.py (__fast_forward / __update_field) against a fine
+# Euler integration of the same growth and water model. fastForward in src/gameLogic/logic.ts is a copy of
+# that update, so keep it in sync when this check changes.
+# Runs under plain CPython: the browser module only exists in Brython, so it is replaced by a stub.
+# Usage: python scripts/check_field_integration.py
+
+import sys
+import types
+from pathlib import Path
+
+SPAN = 30.0
+EULER_STEP = 1e-4
+TOLERANCE = 1e-4
+
+
+class GameData(dict):
+    # Like the JS object in the browser, the game data is accessible both by key and by attribute
+    __getattr__ = dict.__getitem__
+
+
+WORLD_SIZE = 3
+FIELD = [
+    # (type, water) for each cell, row by row
+    ('TREE', 0.8), ('TREE', 0.0), ('NOTHING', 0.5),
+    ('CARROT', 1.0), ('HAY', 0.3), ('BUSH', 0.0),
+    ('SUNFLOWER', 0.6), ('NOTHING', 0.0), ('PUMPKIN', 0.2),
+]  # fmt: skip
+
+browser = types.ModuleType('browser')
+browser.aio = None
+browser.window = types.SimpleNamespace(
+    game_data=GameData(
+        time=0.0,
+        settings={'max_world_size': WORLD_SIZE, 'current_world_size': WORLD_SIZE},
+        field=[
+            {'type': entity, 'growth': 0.0, 'water': water, 'ground': 'DIRT', 'measure': -1} for entity, water in FIELD
+        ],
+    )
+)
+sys.modules['browser'] = browser
+
+game_logic = {}
+exec((Path(__file__).parent.parent / 'public' / 'gameLogic.py').read_text(), game_logic)
+# Brython does not mangle private names inside classes, CPython does, so expose them under the mangled names too
+for name in [name for name in game_logic if name.startswith('__') and not name.endswith('__')]:
+    for class_name in ['Settings', 'Drone', 'Field', 'Inventory']:
+        game_logic[f'_{class_name}{name}'] = game_logic[name]
+
+
+def euler_reference(entity: str, water: float, crowded_neighbours: int) -> tuple[float, float]:
+    growth_rate = game_logic['Entity'][entity].value[3] * 0.5**crowded_neighbours
+    decay_rate = game_logic['__WATER_DECAY_RATE_PER_SECOND']
+    max_water_speedup = game_logic['__MAX_WATER_SPEEDUP']
+
+    growth = 0.0
+    for _ in range(int(SPAN / EULER_STEP)):
+        growth += growth_rate * (max_water_speedup * water + 1) * EULER_STEP
+        water -= decay_rate * water * EULER_STEP
+    return growth, water
+
+
+def crowded_neighbours(x: int, y: int) -> int:
+    if FIELD[WORLD_SIZE * y + x][0] != 'TREE':
+        return 0
+    neighbours = [((x + dx) % WORLD_SIZE, (y + dy) % WORLD_SIZE) for dx, dy in game_logic['__DIRECTION_DELTA']]
+    return sum(FIELD[WORLD_SIZE * ny + nx][0] == 'TREE' for nx, ny in neighbours)
+
+
+def main() -> None:
+    game_logic['__fast_forward'](SPAN)
+
+    failed = False
+    for index, (entity, water) in enumerate(FIELD):
+        x, y = index % WORLD_SIZE, index // WORLD_SIZE
+        cell = browser.window.game_data['field'][index]
+        expected_growth, expected_water = euler_reference(entity, water, crowded_neighbours(x, y))
+        if entity == 'NOTHING':
+            expected_growth = 0.0
+
+        ok = abs(cell['growth'] - expected_growth) < TOLERANCE and abs(cell['water'] - expected_water) < TOLERANCE
+        failed |= not ok
+        print(
+            f'{entity:<10} growth {cell["growth"]:.6f} (euler {expected_growth:.6f}) '
+            f'water {cell["water"]:.6f} (euler {expected_water:.6f}) {"ok" if ok else "MISMATCH"}'
+        )
+
+    assert browser.window.game_data['time'] == SPAN
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
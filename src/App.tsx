@@ -1,13 +1,14 @@
-import React, { useState } from 'react';
+import React, { useRef, useState } from 'react';
 import Editor from './components/Editor';
 import Scene from './components/Scene';
 import InventoryDisplay from './components/Inventory';
+import ConsoleDisplay, { formatConsoleMessage, saveConsoleLog } from './components/Console';
 import './App.css';
 import { Button } from './components/Button';
 import { TimeDisplay } from './components/TimeDisplay';
 import { Communication, Inventory, Settings } from './gameLogic/accessors';
 import { processCode } from './gameLogic/processCode';
-import { initializeGame, loadGame, resetGame, saveGame } from './gameLogic/logic';
+import { initializeGame, loadGame, resetGame, saveGame, saveTelemetry } from './gameLogic/logic';
 import { gameLibraryFunctionParameters, gameLibraryFunctionsWithParams, gameLibraryFunctionsWithoutParams } from './gameLogic/allowed';
 
 const STARTER_CODE = `print('Hello, world!')
@@ -28,11 +29,32 @@ while True:
     print('Time taken:', time() - n)
 print('Goodbye, world!')`;
 
+// Number of console lines shown in the UI
+const CONSOLE_DISPLAY_SIZE = 100;
+// Number of console lines kept for "Save Log", older lines are dropped
+const CONSOLE_LOG_SIZE = 10000;
+
 function App() {
   const [code, setCode] = useState(STARTER_CODE);
   const [time, setTime] = useState(0.0);
   const [running, setRunning] = useState(false);
   const [inventory, setInventory] = useState(Inventory.all());
+  const [consoleLines, setConsoleLines] = useState<string[]>([]);
+  const consoleLog = useRef<string[]>([]);
+
+  const flushConsole = () => {
+    // The python side hands over its buffered messages once per frame, forward them as one batch
+    const messages = Communication.drain_console();
+    if (messages.length === 0) return;
+
+    const lines = messages.map(formatConsoleMessage);
+    console.log(lines.join('\n'));
+    consoleLog.current.push(...lines);
+    if (consoleLog.current.length > CONSOLE_LOG_SIZE) {
+      consoleLog.current.splice(0, consoleLog.current.length - CONSOLE_LOG_SIZE);
+    }
+    setConsoleLines(consoleLog.current.slice(-CONSOLE_DISPLAY_SIZE));
+  }
 
   const startCodeExecution = async () => {
     if (Communication.running) {
@@ -48,6 +70,9 @@ function App() {
     console.log('Running code: ', codeToRun);
 
     loadGame();
+    Communication.drain_console();
+    consoleLog.current = [];
+    setConsoleLines([]);
 
     setInventory(Inventory.all());
     setRunning(Communication.running);
@@ -69,6 +94,7 @@ function App() {
         setTime(Settings.total_play_time);
         setInventory(Inventory.all());
         setRunning(Communication.running);
+        flushConsole();
         last_time = Settings.total_play_time;
       }
     }
@@ -83,6 +109,7 @@ function App() {
     setTime(Settings.total_play_time);
     setInventory(Inventory.all());
     setRunning(Communication.running);
+    flushConsole();
 
     console.log('Done');
   }
@@ -105,12 +132,14 @@ function App() {
             <div style={{ display: 'flex', flexDirection: 'column' }}>
               <Button onClick={saveGame} disabled={running}>Save</Button>
               <Button onClick={resetGame} disabled={running}>Reset</Button>
+              <Button onClick={saveTelemetry} disabled={running}>Telemetry</Button>
             </div>
           </div>
           <Editor onCodeChange={setCode} code={code} />
         </div>
         <Scene time={time} />
         <InventoryDisplay inventory={inventory} />
+        <ConsoleDisplay lines={consoleLines} onSave={() => saveConsoleLog(consoleLog.current)} />
         <div style={{ margin: 5, padding: 5, border: '1px solid black' }}>
           <p>Available functions:</p>
           {gameLibraryFunctionsWithParams.map(func => (
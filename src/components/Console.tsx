@@ -0,0 +1,30 @@
+import React from 'react';
+import { Button } from './Button';
+import { ConsoleMessage } from '../gameLogic/enums';
+import { downloadFile } from '../gameLogic/logic';
+
+export function formatConsoleMessage({ time, drone, message }: ConsoleMessage): string {
+  return `[${time.toFixed(2)}s] Drone ${drone}: ${message}`;
+}
+
+export function saveConsoleLog(lines: string[]) {
+  // Saves the log of the current run (up to CONSOLE_LOG_SIZE lines) to a text file, the panel only shows the latest lines
+  downloadFile('console.log', lines.join('\n'));
+}
+
+interface ConsoleProps {
+  lines: string[];
+  onSave: () => unknown;
+}
+
+const Console: React.FC<ConsoleProps> = ({ lines, onSave }) => (
+  <div style={{ display: 'flex', flexDirection: 'column', margin: 5, padding: 5, border: '1px solid black' }}>
+    <p>Console</p>
+    <Button onClick={onSave} disabled={lines.length === 0}>Save Log</Button>
+    <pre style={{ height: 200, overflowY: 'auto', textAlign: 'left' }}>
+      {lines.join('\n')}
+    </pre>
+  </div>
+);
+
+export default Console;
@@ -1,4 +1,4 @@
-import { Entity, EntityKey, EntityType, FieldEntry, GameData, Ground, GroundKey, GroundType, ItemKey } from "./enums";
+import { ConsoleMessage, Entity, EntityKey, EntityType, FieldEntry, GameData, Ground, GroundKey, GroundType, ItemKey } from "./enums";
 
 export function game_data(): GameData | undefined {
     // eslint-disable-next-line @typescript-eslint/no-explicit-any
@@ -65,6 +65,15 @@ export class Communication {
         if (gameData === undefined) return;
         gameData.communication.error = value;
     }
+
+    // Returns all messages the python side flushed since the last call and clears them
+    static drain_console(): ConsoleMessage[] {
+        const gameData = game_data();
+        if (gameData === undefined) return [];
+        const messages = gameData.communication.console ?? [];
+        gameData.communication.console = [];
+        return messages;
+    }
 }
 
 // Drone class
@@ -88,12 +88,29 @@ export type FieldEntry = {
     measure: number; // -1 for no measure
 };
 
+export type ConsoleMessage = {
+    time: number;
+    drone: number;
+    message: string;
+};
+
+export type Telemetry = {
+    interval: number;
+    time: number[];
+    power_drained: number[];
+    buckets_filled: number[];
+    growth_utilisation: number[];
+    inventory: Record<ItemKey, number[]>;
+    produced_per_minute: Record<ItemKey, number[]>;
+};
+
 export type GameData = {
     time: number;
     communication: {
         running: boolean;
         stop_running: boolean;
         error: string | null;
+        console: ConsoleMessage[];
     };
     settings: {
         speedup: number;
@@ -108,6 +125,10 @@ export type GameData = {
     inventory: {
         [key in ItemKey]: number;
     };
+    // Production time series of the last run, only present after a script was run
+    telemetry?: Telemetry;
+    // Unix time in milliseconds of the last save, used to catch up on the time passed since then
+    saved_at?: number;
     unlocks: {
         speed: number;
         expand: number;
@@ -1,5 +1,11 @@
 import { game_data, set_game_data } from "./accessors";
-import { Entity, GameData, Ground, Item, ItemKey } from "./enums";
+import { Entity, GameData, Ground, Item, ItemKey, Telemetry } from "./enums";
+
+// Copies of __WATER_DECAY_RATE_PER_SECOND, __BUCKET_FILL_PERCENTAGE_PER_SECOND and __MAX_WATER_SPEEDUP in
+// public/gameLogic.py, used by fastForward. Change both files together.
+const WATER_DECAY_RATE_PER_SECOND = 0.04;
+const BUCKET_FILL_PERCENTAGE_PER_SECOND = 0.05;
+const MAX_WATER_SPEEDUP = 5;
 
 export function initializeGame() {
     const max_world_size = 3;
@@ -10,6 +16,7 @@ export function initializeGame() {
             running: false,
             stop_running: false,
             error: null,
+            console: [],
         },
         settings: {
             speedup: 1,
@@ -60,6 +67,7 @@ export function initializeGame() {
 export const saveGame = () => {
     const gameData = game_data();
     if (gameData === undefined) return;
+    gameData.saved_at = Date.now();
     localStorage.setItem('saveData', JSON.stringify(gameData));
 }
 
@@ -72,10 +80,101 @@ export const loadGame = () => {
     }
     const gameData = JSON.parse(saveData);
     if (gameData === undefined) return;
+    if (gameData.saved_at !== undefined) {
+        // Catch up on the time that passed since the game was saved
+        fastForward(gameData, Math.max(0, (Date.now() - gameData.saved_at) / 1000));
+    }
     set_game_data(gameData);
 }
 
+// Advances the field and the buckets by the given time span in a single pass over the field.
+// This is a copy of __update_field and __fill_buckets in public/gameLogic.py, change both files together.
+// The field is integrated analytically, so the cost does not depend on the length of the time span.
+// gameData.time is not advanced, as the play time only counts the time scripts were running.
+export const fastForward = (gameData: GameData, seconds: number) => {
+    const { max_world_size, current_world_size } = gameData.settings;
+    const cell = (x: number, y: number) => gameData.field[max_world_size * y + x];
+    const clamp01 = (value: number) => Math.min(1, Math.max(0, value));
+
+    // The water level decays exponentially: w(t) = w0 * e^(-decay * t)
+    const waterDecayFactor = Math.exp(-WATER_DECAY_RATE_PER_SECOND * seconds);
+
+    for (let y = 0; y < current_world_size; y++) {
+        for (let x = 0; x < current_world_size; x++) {
+            const entry = cell(x, y);
+            const waterLevel = clamp01(entry.water);
+
+            if (entry.type !== 'NOTHING') {
+                // Integral of the water speedup (MAX_WATER_SPEEDUP * w(t) + 1) over the time span
+                const boostedTime = seconds + MAX_WATER_SPEEDUP * waterLevel * (1 - waterDecayFactor) / WATER_DECAY_RATE_PER_SECOND;
+                let growthRate = Entity[entry.type].growthRate;
+
+                if (entry.type === 'TREE') {
+                    // Trees grow slower if there are trees around
+                    for (const [dx, dy] of [[0, 1], [1, 0], [0, -1], [-1, 0]]) {
+                        const nx = (x + dx + current_world_size) % current_world_size;
+                        const ny = (y + dy + current_world_size) % current_world_size;
+                        if (cell(nx, ny).type === 'TREE') growthRate *= 0.5;
+                    }
+                }
+
+                entry.growth = clamp01(entry.growth) + growthRate * boostedTime;
+            }
+
+            entry.water = waterLevel * waterDecayFactor;
+        }
+    }
+
+    // Only existing empty buckets can be filled
+    const bucketsToFill = Math.min(
+        Math.floor(seconds * BUCKET_FILL_PERCENTAGE_PER_SECOND),
+        Math.max(0, Math.floor(gameData.inventory.EMPTY_BUCKET)),
+    );
+    gameData.inventory.FULL_BUCKET += bucketsToFill;
+    gameData.inventory.EMPTY_BUCKET -= bucketsToFill;
+}
+
 export const resetGame = () => {
     initializeGame();
     saveGame();
 }
+
+export const downloadFile = (fileName: string, content: string, type: string = 'text/plain') => {
+    const blob = new Blob([content], { type });
+    const url = URL.createObjectURL(blob);
+    const link = document.createElement('a');
+    link.href = url;
+    link.download = fileName;
+    link.click();
+    URL.revokeObjectURL(url);
+}
+
+export const telemetryToCsv = (telemetry: Telemetry): string => {
+    const items = Object.keys(telemetry.inventory) as ItemKey[];
+    const header = [
+        'time',
+        'power_drained',
+        'buckets_filled',
+        'growth_utilisation',
+        ...items,
+        ...items.map(item => `${item}_produced_per_minute`),
+    ];
+    const rows = telemetry.time.map((time, i) => [
+        time,
+        telemetry.power_drained[i],
+        telemetry.buckets_filled[i],
+        telemetry.growth_utilisation[i],
+        ...items.map(item => telemetry.inventory[item][i]),
+        ...items.map(item => telemetry.produced_per_minute[item][i]),
+    ]);
+    return [header, ...rows].map(row => row.join(',')).join('\n');
+}
+
+export const saveTelemetry = () => {
+    const telemetry = game_data()?.telemetry;
+    if (telemetry === undefined) {
+        console.error('No telemetry recorded yet');
+        return;
+    }
+    downloadFile('telemetry.csv', telemetryToCsv(telemetry), 'text/csv');
+}